@@ -0,0 +1,115 @@
+"""Static certificate layout, kept free of AWS imports so it can be pre-built offline"""
+from io import BytesIO
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import A4, landscape
+
+PLEDGE_LINES = [
+    "has taken the Integrity Pledge and commits to:",
+    "",
+    "• Protecting the company's integrity and reputation",
+    "• Staying alert and questioning what feels wrong",
+    "• Always choosing ethics over convenience",
+    "• Ensuring every customer can trust our promise",
+    "• Contributing to a culture of honesty and accountability"
+]
+
+# (font, size, text) for each pledge line: bullets bold, intro plain
+PLEDGE_LAYOUT = [
+    ("Helvetica-Bold", 12, line) if line.startswith("•") else ("Helvetica", 13, line)
+    for line in PLEDGE_LINES
+]
+
+# Fonts registered, in this order, on both the template and the overlay canvas
+# so their internal resource names (/F1, /F2, ...) line up
+CERTIFICATE_FONTS = ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique", "Courier")
+
+def register_certificate_fonts(pdf):
+    """Register certificate fonts on a canvas in a fixed order"""
+    for font in CERTIFICATE_FONTS:
+        pdf.setFont(font, 10)
+
+def generate_static_template():
+    """Render the static certificate layout (borders, headings, pledge, footer) once"""
+    buffer = BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=landscape(A4))
+    width, height = landscape(A4)
+    register_certificate_fonts(pdf)
+
+    # Keep the layout's graphics state from leaking into the appended overlay
+    pdf.saveState()
+
+    # Soft background
+    pdf.setFillColorRGB(0.95, 0.95, 1.0)
+    pdf.rect(0, 0, width, height, fill=True, stroke=False)
+
+    # Borders
+    pdf.setStrokeColorRGB(0.4, 0.5, 0.9)
+    pdf.setLineWidth(8)
+    pdf.rect(30, 30, width-60, height-60, fill=False, stroke=True)
+    pdf.setStrokeColorRGB(0.5, 0.6, 1.0)
+    pdf.setLineWidth(3)
+    pdf.rect(40, 40, width-80, height-80, fill=False, stroke=True)
+
+    # Corner decorations
+    corner_size = 50
+    pdf.setStrokeColorRGB(0.6, 0.4, 0.8)
+    pdf.setLineWidth(5)
+    for x_pos, y_pos in [(50, height-50), (width-50, height-50), (50, 50), (width-50, 50)]:
+        pdf.line(x_pos, y_pos, min(x_pos + corner_size, width-10), y_pos)
+        if y_pos < height / 2:
+            pdf.line(x_pos, y_pos, x_pos, y_pos + corner_size)
+        else:
+            pdf.line(x_pos, y_pos, x_pos, y_pos - corner_size)
+
+    # Title
+    pdf.setFillColorRGB(0.2, 0.2, 0.5)
+    pdf.setFont("Helvetica-Bold", 36)
+    pdf.drawCentredString(width/2, height-100, "CERTIFICATE OF INTEGRITY")
+
+    # Subtitle
+    pdf.setFillColorRGB(0.8, 0.2, 0.2)
+    pdf.setFont("Helvetica-Bold", 24)
+    pdf.drawCentredString(width/2, height-140, "Fraud Awareness Week")
+
+    # Decorative line
+    pdf.setStrokeColorRGB(0.6, 0.4, 0.8)
+    pdf.setLineWidth(2)
+    pdf.line(width/2-200, height-155, width/2+200, height-155)
+
+    # Body text
+    pdf.setFillColorRGB(0.2, 0.2, 0.2)
+    pdf.setFont("Helvetica", 14)
+    pdf.drawCentredString(width/2, height-200, "This certifies that")
+
+    # Pledge content
+    pdf.setFillColorRGB(0.2, 0.2, 0.2)
+    cx = width / 2
+    y_position = height - 320
+    for font, size, line in PLEDGE_LAYOUT:
+        pdf.setFont(font, size)
+        pdf.drawCentredString(cx, y_position, line)
+        y_position -= 25
+
+    # Signature line
+    pdf.setLineWidth(1)
+    pdf.setStrokeColorRGB(0.5, 0.5, 0.5)
+    pdf.line(width-300, 80, width-100, 80)
+    pdf.setFillColorRGB(0.3, 0.3, 0.3)
+    pdf.setFont("Helvetica", 10)
+    pdf.drawCentredString(width-200, 105, "Authorized Signature")
+
+    # Footer
+    pdf.setFont("Helvetica-Oblique", 10)
+    pdf.setFillColorRGB(0.5, 0.5, 0.5)
+    pdf.drawCentredString(width/2, 65, "Building Trust Through Integrity")
+    pdf.drawCentredString(width/2, 50, "© 2025 Edelweiss Life Insurance. All Rights Reserved.")
+
+    pdf.restoreState()
+    pdf.save()
+    return buffer.getvalue()
+
+if __name__ == '__main__':
+    # Pre-build the template for bundling into the deployment package
+    with open('certificate_template.pdf', 'wb') as f:
+        f.write(generate_static_template())
+    print("✓ Wrote certificate_template.pdf")
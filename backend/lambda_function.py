@@ -1,181 +1,382 @@
 import json
+import orjson
 import boto3
 import csv
+import functools
 import os
+import pickle
+import re
+import time
+import threading
 from datetime import datetime
-from io import StringIO, BytesIO
+from io import BytesIO, TextIOWrapper
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.lib import colors
-import uuid
+from reportlab.pdfbase import pdfmetrics
+from pypdf import PdfReader, PdfWriter
+from pypdf.errors import PyPdfError
+from pypdf.generic import DecodedStreamObject
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from certificate_template import CERTIFICATE_FONTS, register_certificate_fonts, generate_static_template
 
-# Initialize AWS clients
-s3_client = boto3.client('s3')
-dynamodb = boto3.resource('dynamodb')
+# Initialize AWS clients: pool sized for the concurrent S3/DynamoDB calls,
+# kept-alive connections, and adaptive retries to back off under throttling
+_AWS_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 3}
+)
+s3_client = boto3.client('s3', config=_AWS_CONFIG)
+dynamodb = boto3.resource('dynamodb', config=_AWS_CONFIG)
+
+# Worker threads for overlapping independent AWS calls
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
 
 # Environment variables
 BUCKET_NAME = os.environ.get('BUCKET_NAME', 'pledge-certificate-generation-project')
 CSV_KEY = os.environ.get('CSV_KEY', 'employees.csv')
 DYNAMODB_TABLE = os.environ.get('DYNAMODB_TABLE', 'IntegrityPledges')
+TEMPLATE_PDF_PATH = os.environ.get(
+    'TEMPLATE_PDF_PATH',
+    os.path.join(os.environ.get('LAMBDA_TASK_ROOT', '/var/task'), 'certificate_template.pdf')
+)
+EMPLOYEES_SNAPSHOT_PATH = os.environ.get('EMPLOYEES_SNAPSHOT_PATH', '/tmp/employees.pkl')
 
-# In-memory cache
-employee_cache = {'data': None, 'timestamp': None}
+# In-memory cache (monotonic load time, so clock changes cannot extend the TTL),
+# with the CSV ETag it was parsed from for conditional refreshes
+_CACHE_DATA = None
+_CACHE_ETAG = None
+_CACHE_TS = 0.0
 CACHE_TTL = 300
 
+# CSVs larger than this are fetched as concurrent byte ranges
+CSV_RANGE_CHUNK = 4 * 1024 * 1024
+CSV_RANGE_THRESHOLD = 2 * CSV_RANGE_CHUNK
+
+# Pending pledge records, written to DynamoDB in batches. The flush lock is
+# held for the whole write, so a drain returns only once earlier writes land
+_PLEDGE_QUEUE = []
+_PLEDGE_QUEUE_LOCK = threading.Lock()
+_PLEDGE_FLUSH_LOCK = threading.Lock()
+BATCH_WRITE_LIMIT = 25          # BatchWriteItem maximum
+BATCH_MAX_RETRIES = 5
+BATCH_RETRY_BASE_DELAY = 0.05   # seconds, doubled per retry
+
+# Response headers only carry Content-Type (Function URL handles CORS)
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Constant response bodies and the success body template; only the
+# employee-specific values are JSON-encoded per request
+_MISSING_ID_BODY = orjson.dumps({'success': False, 'message': 'Employee ID is required'}).decode()
+_PLEDGE_NOT_ACCEPTED_BODY = orjson.dumps({'success': False, 'message': 'Pledge must be accepted'}).decode()
+_SUCCESS_BODY_TEMPLATE = (
+    '{{"success":true,"message":"Pledge submitted successfully",'
+    '"employee_name":{},"employee_id":{},"department":{},"designation":{},'
+    '"pledge_id":{},"certificate_size_kb":{},'
+)
+
+# Presigned certificate download URL lifetime (seconds)
+CERTIFICATE_URL_TTL = 3600
+
+def _load_employees_snapshot():
+    """Load (etag, employees) from the /tmp snapshot, or None if there is none"""
+    try:
+        with open(EMPLOYEES_SNAPSHOT_PATH, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return None
+
+def _save_employees_snapshot(etag, employees):
+    """Snapshot parsed employees to /tmp for later cold starts in this sandbox"""
+    tmp_path = f"{EMPLOYEES_SNAPSHOT_PATH}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((etag, employees), f, protocol=5)
+        os.replace(tmp_path, EMPLOYEES_SNAPSHOT_PATH)
+    except OSError as e:
+        print(f"⚠ Employee snapshot save failed (non-critical): {str(e)}")
+
+def _csv_cell(row, col):
+    """Cell value, or 'N/A' when the column is absent or the row is short"""
+    return row[col] if col is not None and col < len(row) else 'N/A'
+
+def _fetch_csv_ranges(etag, content_length):
+    """Fetch a large CSV with concurrent byte-range GETs"""
+    def fetch_range(start):
+        end = min(start + CSV_RANGE_CHUNK, content_length) - 1
+        # IfMatch keeps every part on the object version that was sized
+        response = s3_client.get_object(
+            Bucket=BUCKET_NAME,
+            Key=CSV_KEY,
+            Range=f'bytes={start}-{end}',
+            IfMatch=etag
+        )
+        return response['Body'].read()
+
+    parts = _EXECUTOR.map(fetch_range, range(0, content_length, CSV_RANGE_CHUNK))
+    return BytesIO(b''.join(parts))
+
+def _parse_employees(body):
+    """Parse the employee CSV into employee_id -> (name, department, designation)"""
+    csv_reader = csv.reader(TextIOWrapper(body, encoding='utf-8', newline=''))
+    header = next(csv_reader)
+    idx = {name: i for i, name in enumerate(header)}
+    id_col, name_col = idx['employee_id'], idx.get('employee_name')
+    dept_col, desig_col = idx.get('department'), idx.get('designation')
+    # Rows without an ID are skipped, missing cells or columns become 'N/A'
+    return {
+        row[id_col]: (_csv_cell(row, name_col), _csv_cell(row, dept_col), _csv_cell(row, desig_col))
+        for row in csv_reader if id_col < len(row)
+    }
+
 def load_employees_from_s3():
     """Load employee data from S3 CSV with caching"""
-    global employee_cache
-    current_time = datetime.now().timestamp()
-    
-    if employee_cache['data'] and employee_cache['timestamp']:
-        if current_time - employee_cache['timestamp'] < CACHE_TTL:
-            print(f"✓ Using cached employee data ({len(employee_cache['data'])} employees)")
-            return employee_cache['data']
+    global _CACHE_DATA, _CACHE_TS, _CACHE_ETAG
+    now = time.monotonic()
     
-    print(f"Loading employees from S3: s3://{BUCKET_NAME}/{CSV_KEY}")
+    if _CACHE_DATA is not None and now - _CACHE_TS < CACHE_TTL:
+        return _CACHE_DATA
     
     try:
-        response = s3_client.get_object(Bucket=BUCKET_NAME, Key=CSV_KEY)
-        csv_content = response['Body'].read().decode('utf-8')
-        csv_reader = csv.DictReader(StringIO(csv_content))
-        employees = {row['employee_id']: row for row in csv_reader}
-        employee_cache['data'] = employees
-        employee_cache['timestamp'] = current_time
-        print(f"✓ Loaded {len(employees)} employees from S3")
+        # Revalidate what is already parsed: in-memory data on a TTL refresh,
+        # otherwise the /tmp snapshot left by an earlier cold start
+        employees, etag = _CACHE_DATA, _CACHE_ETAG
+        if employees is None:
+            snapshot = _load_employees_snapshot()
+            if snapshot is not None:
+                etag, employees = snapshot
+        
+        try:
+            conditional = {'IfNoneMatch': etag} if employees is not None else {}
+            response = s3_client.get_object(Bucket=BUCKET_NAME, Key=CSV_KEY, **conditional)
+        except ClientError as e:
+            if employees is None or e.response['ResponseMetadata']['HTTPStatusCode'] != 304:
+                raise
+            print(f"✓ Employee CSV unchanged, reusing {len(employees)} parsed employees")
+        else:
+            print(f"Loading employees from S3: s3://{BUCKET_NAME}/{CSV_KEY}")
+            etag = response['ETag']
+            if response['ContentLength'] > CSV_RANGE_THRESHOLD:
+                # Too large to stream in one GET; re-fetch as concurrent ranges
+                response['Body'].close()
+                body = _fetch_csv_ranges(etag, response['ContentLength'])
+            else:
+                # Parse straight off the S3 stream instead of buffering the whole file
+                body = response['Body']
+            employees = _parse_employees(body)
+            _save_employees_snapshot(etag, employees)
+            print(f"✓ Loaded {len(employees)} employees from S3")
+        _CACHE_DATA, _CACHE_ETAG = employees, etag
+        _CACHE_TS = now
         return employees
     except Exception as e:
         print(f"✗ Error loading employees: {str(e)}")
         raise
 
-def generate_certificate_pdf(employee_name, employee_id, department, designation, pledge_date=None):
-    """Generate professional horizontal PDF certificate"""
-    buffer = BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=landscape(A4))
-    width, height = landscape(A4)
+# Resolve font metrics at cold start; per-request centring uses these directly
+_FONT_OBJECTS = {font: pdfmetrics.getFont(font) for font in CERTIFICATE_FONTS}
 
-    # Soft background
-    pdf.setFillColorRGB(0.95, 0.95, 1.0)
-    pdf.rect(0, 0, width, height, fill=True, stroke=False)
-
-    # Borders
-    pdf.setStrokeColorRGB(0.4, 0.5, 0.9)
-    pdf.setLineWidth(8)
-    pdf.rect(30, 30, width-60, height-60, fill=False, stroke=True)
-    pdf.setStrokeColorRGB(0.5, 0.6, 1.0)
-    pdf.setLineWidth(3)
-    pdf.rect(40, 40, width-80, height-80, fill=False, stroke=True)
-
-    # Corner decorations
-    corner_size = 50
-    pdf.setStrokeColorRGB(0.6, 0.4, 0.8)
-    pdf.setLineWidth(5)
-    for x_pos, y_pos in [(50, height-50), (width-50, height-50), (50, 50), (width-50, 50)]:
-        pdf.line(x_pos, y_pos, min(x_pos + corner_size, width-10), y_pos)
-        if y_pos < height / 2:
-            pdf.line(x_pos, y_pos, x_pos, y_pos + corner_size)
-        else:
-            pdf.line(x_pos, y_pos, x_pos, y_pos - corner_size)
+# Never saved; only used to format the overlay text operators
+_OVERLAY_CANVAS = canvas.Canvas(BytesIO(), pagesize=landscape(A4))
+register_certificate_fonts(_OVERLAY_CANVAS)
+_FONT_OPERATOR = re.compile(r'(/F\d+) [\d.]+ Tf')
+
+def load_static_template():
+    """Load the pre-built certificate template, rendering it if not bundled"""
+    try:
+        with open(TEMPLATE_PDF_PATH, 'rb') as f:
+            template_bytes = f.read()
+        print(f"✓ Loaded certificate template from {TEMPLATE_PDF_PATH}")
+        return template_bytes
+    except OSError:
+        print(f"Certificate template not found at {TEMPLATE_PDF_PATH}, rendering it")
+        return generate_static_template()
+
+def _text_font_names(code):
+    """Font resource names selected by Tf operators in text object code"""
+    return set(_FONT_OPERATOR.findall(code))
+
+def _overlay_font_name(font):
+    """Resource name the overlay canvas uses for a font"""
+    text = _OVERLAY_CANVAS.beginText()
+    text.setFont(font, 10)
+    return _text_font_names(text.getCode()).pop()
 
-    # Title
-    pdf.setFillColorRGB(0.2, 0.2, 0.5)
-    pdf.setFont("Helvetica-Bold", 36)
-    pdf.drawCentredString(width/2, height-100, "CERTIFICATE OF INTEGRITY")
+def _template_fonts_match(page):
+    """Check the template uses the same font resource names as the overlay"""
+    fonts = page['/Resources']['/Font']
+    for font in CERTIFICATE_FONTS:
+        name = _overlay_font_name(font)
+        if name not in fonts or fonts[name]['/BaseFont'] != '/' + font:
+            return False
+    return True
 
-    # Subtitle
-    pdf.setFillColorRGB(0.8, 0.2, 0.2)
-    pdf.setFont("Helvetica-Bold", 24)
-    pdf.drawCentredString(width/2, height-140, "Fraud Awareness Week")
+def load_template_page():
+    """Parse the template into a page object reused across warm invocations"""
+    global STATIC_PDF_BYTES
+    try:
+        page = PdfReader(BytesIO(STATIC_PDF_BYTES)).pages[0]
+        if _template_fonts_match(page):
+            return page
+        print("⚠ Certificate template fonts do not match the overlay, re-rendering")
+    except PyPdfError as e:
+        print(f"⚠ Certificate template unreadable, re-rendering: {str(e)}")
+    STATIC_PDF_BYTES = generate_static_template()
+    return PdfReader(BytesIO(STATIC_PDF_BYTES)).pages[0]
+
+# Static certificate layout, loaded and parsed once per cold start
+STATIC_PDF_BYTES = load_static_template()
+TEMPLATE_PAGE = load_template_page()
+TEMPLATE_CONTENT = TEMPLATE_PAGE.get_contents().get_data()
+TEMPLATE_FONT_NAMES = set(TEMPLATE_PAGE['/Resources']['/Font'].keys())
 
-    # Decorative line
-    pdf.setStrokeColorRGB(0.6, 0.4, 0.8)
-    pdf.setLineWidth(2)
-    pdf.line(width/2-200, height-155, width/2+200, height-155)
+def _centred_text(text, font, size, x, y, line):
+    """Add a line centred on x to a text object"""
+    text.setFont(font, size)
+    text.setTextOrigin(x - _FONT_OBJECTS[font].stringWidth(line, size) / 2, y)
+    text.textOut(line)
 
-    # Body text
-    pdf.setFillColorRGB(0.2, 0.2, 0.2)
-    pdf.setFont("Helvetica", 14)
-    pdf.drawCentredString(width/2, height-200, "This certifies that")
+def _overlay_text(text, employee_name, employee_id, department, designation, date_str, cert_date):
+    """Add the employee-specific lines to a text object"""
+    width, height = landscape(A4)
 
     # Employee name
-    pdf.setFillColorRGB(0.1, 0.1, 0.5)
-    pdf.setFont("Helvetica-Bold", 28)
-    pdf.drawCentredString(width/2, height-240, employee_name.upper())
+    text.setFillColorRGB(0.1, 0.1, 0.5)
+    _centred_text(text, "Helvetica-Bold", 28, width/2, height-240, employee_name.upper())
 
     # Employee details
-    pdf.setFillColorRGB(0.3, 0.3, 0.3)
-    pdf.setFont("Helvetica", 12)
-    pdf.drawCentredString(width/2, height-270, f"Employee ID: {employee_id} | Department: {department} | Designation: {designation}")
-
-    # Pledge content
-    pdf.setFillColorRGB(0.2, 0.2, 0.2)
-    pdf.setFont("Helvetica", 13)
-    y_position = height - 320
-
-    pledge_lines = [
-        "has taken the Integrity Pledge and commits to:",
-        "",
-        "• Protecting the company's integrity and reputation",
-        "• Staying alert and questioning what feels wrong",
-        "• Always choosing ethics over convenience",
-        "• Ensuring every customer can trust our promise",
-        "• Contributing to a culture of honesty and accountability"
-    ]
-
-    for line in pledge_lines:
-        if line.startswith("•"):
-            pdf.setFont("Helvetica-Bold", 12)
-        else:
-            pdf.setFont("Helvetica", 13)
-        pdf.drawCentredString(width/2, y_position, line)
-        y_position -= 25
-
-    # Date and signature  (bottom left)
-    pdf.setFont("Helvetica", 11)
-    pdf.setFillColorRGB(0.3, 0.3, 0.3)
-    date_str = datetime.now().strftime("%B %d, %Y")
-    pdf.drawString(100, 80, f"Date of Pledge: {date_str}")
-
-    # Signature line
-    pdf.setLineWidth(1)
-    pdf.setStrokeColorRGB(0.5, 0.5, 0.5)
-    pdf.line(width-300, 80, width-100, 80)
-    pdf.setFont("Helvetica", 10)
-    pdf.drawCentredString(width-200, 105, "Authorized Signature")
-
-    # Footer
-    pdf.setFont("Helvetica-Oblique", 10)
-    pdf.setFillColorRGB(0.5, 0.5, 0.5)
-    pdf.drawCentredString(width/2, 65, "Building Trust Through Integrity")
-    pdf.drawCentredString(width/2, 50, "© 2025 Edelweiss Life Insurance. All Rights Reserved.")
+    text.setFillColorRGB(0.3, 0.3, 0.3)
+    _centred_text(text, "Helvetica", 12, width/2, height-270, f"Employee ID: {employee_id} | Department: {department} | Designation: {designation}")
+
+    # Date of pledge (bottom left)
+    text.setFont("Helvetica", 11)
+    text.setTextOrigin(100, 80)
+    text.textOut(f"Date of Pledge: {date_str}")
 
     # Certificate ID
-    cert_id = f"FAW-{datetime.now().strftime('%Y%m%d')}-{employee_id}"
-    pdf.setFont("Courier", 8)
-    pdf.drawString(50, 20, f"Certificate ID: {cert_id}")
+    cert_id = f"FAW-{cert_date}-{employee_id}"
+    text.setFillColorRGB(0.5, 0.5, 0.5)
+    text.setFont("Courier", 8)
+    text.setTextOrigin(50, 20)
+    text.textOut(f"Certificate ID: {cert_id}")
 
+def _render_overlay_page(*details):
+    """Render the employee-specific lines as a standalone overlay page"""
+    buffer = BytesIO()
+    # Uncompressed, as merge_page would only inflate the stream again
+    pdf = canvas.Canvas(buffer, pagesize=landscape(A4), pageCompression=0)
+    text = pdf.beginText()
+    _overlay_text(text, *details)
+    pdf.drawText(text)
     pdf.save()
-    buffer.seek(0)
+    return PdfReader(buffer).pages[0]
+
+def generate_certificate_pdf(employee_name, employee_id, department, designation, date_str, cert_date):
+    """Stamp employee details onto the cached certificate template"""
+    details = (employee_name, employee_id, department, designation, date_str, cert_date)
+    text = _OVERLAY_CANVAS.beginText()
+    _overlay_text(text, *details)
+    code = text.getCode()
+
+    writer = PdfWriter()
+    page = writer.add_page(TEMPLATE_PAGE)
+    if _text_font_names(code) <= TEMPLATE_FONT_NAMES:
+        # Append the overlay operators to the template's content stream, so
+        # neither stream is parsed or re-encoded per request
+        content = DecodedStreamObject()
+        content.set_data(TEMPLATE_CONTENT + b"\n" + code.encode('latin-1'))
+        page.replace_contents(content)
+    else:
+        # Characters outside WinAnsi pull in ReportLab fallback fonts the
+        # template does not declare; merge a real overlay page so pypdf
+        # carries their font resources across
+        page.merge_page(_render_overlay_page(*details))
+
+    # getvalue() hands back BytesIO's internal buffer without copying it
+    buffer = BytesIO()
+    writer.write(buffer)
     return buffer.getvalue()
 
-def save_pledge_to_dynamodb(employee_id, employee_name, department, designation, pledge_id):
-    """Save pledge to DynamoDB"""
+@functools.lru_cache(maxsize=256)
+def _build_pdf_cached(employee_name, employee_id, department, designation, date_str, cert_date):
+    """Memoised certificate build, so same-day resubmissions skip PDF generation"""
+    return generate_certificate_pdf(employee_name, employee_id, department, designation, date_str, cert_date)
+
+def save_pledge_to_dynamodb(employee_id, employee_name, department, designation, pledge_id, pledge_timestamp):
+    """Queue pledge for the handler's next flush_pledge_queue"""
+    item = {
+        'pledge_id': pledge_id,
+        'employee_id': employee_id,
+        'employee_name': employee_name,
+        'department': department,
+        'designation': designation,
+        'pledge_timestamp': pledge_timestamp,
+        'status': 'completed'
+    }
+    with _PLEDGE_QUEUE_LOCK:
+        _PLEDGE_QUEUE.append(item)
+
+def flush_pledge_queue():
+    """Write all queued pledges to DynamoDB in BatchWriteItem chunks"""
+    with _PLEDGE_FLUSH_LOCK:
+        with _PLEDGE_QUEUE_LOCK:
+            items = _PLEDGE_QUEUE[:]
+            _PLEDGE_QUEUE.clear()
+
+        for start in range(0, len(items), BATCH_WRITE_LIMIT):
+            _batch_write_pledges(items[start:start + BATCH_WRITE_LIMIT])
+
+def _batch_write_pledges(items):
+    """BatchWriteItem with exponential backoff on unprocessed items"""
+    request_items = {DYNAMODB_TABLE: [{'PutRequest': {'Item': item}} for item in items]}
     try:
-        table = dynamodb.Table(DYNAMODB_TABLE)
-        item = {
-            'pledge_id': pledge_id,
-            'employee_id': employee_id,
-            'employee_name': employee_name,
-            'department': department,
-            'designation': designation,
-            'pledge_timestamp': datetime.now().isoformat(),
-            'status': 'completed'
-        }
-        table.put_item(Item=item)
-        print(f"✓ Pledge saved to DynamoDB for {employee_id}")
+        for attempt in range(BATCH_MAX_RETRIES):
+            response = dynamodb.batch_write_item(RequestItems=request_items)
+            request_items = response.get('UnprocessedItems')
+            if not request_items:
+                print(f"✓ {len(items)} pledge(s) saved to DynamoDB")
+                return
+            time.sleep(BATCH_RETRY_BASE_DELAY * (2 ** attempt))
+        unprocessed = len(request_items.get(DYNAMODB_TABLE, []))
+        print(f"⚠ DynamoDB save incomplete (non-critical): {unprocessed} pledge(s) unprocessed")
     except Exception as e:
         print(f"⚠ DynamoDB save failed (non-critical): {str(e)}")
 
+def upload_certificate_to_s3(s3_key, pdf_bytes):
+    """Upload certificate PDF to S3"""
+    try:
+        s3_client.put_object(
+            Bucket=BUCKET_NAME,
+            Key=s3_key,
+            Body=pdf_bytes,
+            ContentType='application/pdf'
+        )
+        print(f"✓ Certificate uploaded to S3: {s3_key}")
+        return True
+    except Exception as e:
+        print(f"⚠ S3 upload failed, falling back to inline PDF: {str(e)}")
+        return False
+
+def generate_certificate_url(s3_key, employee_id):
+    """Generate a presigned download URL for an uploaded certificate"""
+    return s3_client.generate_presigned_url(
+        'get_object',
+        Params={
+            'Bucket': BUCKET_NAME,
+            'Key': s3_key,
+            'ResponseContentDisposition': f'attachment; filename="Integrity_Certificate_{employee_id}.pdf"'
+        },
+        ExpiresIn=CERTIFICATE_URL_TTL
+    )
+
+def _json_value(value):
+    """JSON-encode a single value for splicing into a body template"""
+    return orjson.dumps(value).decode()
+
 def lambda_handler(event, context):
     """Main Lambda handler - CORS handled by Function URL"""
     print(f"Received event: {json.dumps(event)}")
@@ -194,15 +395,15 @@ def lambda_handler(event, context):
         if not employee_id:
             return {
                 'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},  # Only Content-Type
-                'body': json.dumps({'success': False, 'message': 'Employee ID is required'})
+                'headers': _JSON_HEADERS,
+                'body': _MISSING_ID_BODY
             }
         
         if not pledge_accepted:
             return {
                 'statusCode': 400,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({'success': False, 'message': 'Pledge must be accepted'})
+                'headers': _JSON_HEADERS,
+                'body': _PLEDGE_NOT_ACCEPTED_BODY
             }
         
         # Load employee data
@@ -212,60 +413,58 @@ def lambda_handler(event, context):
         if employee_id not in employees:
             return {
                 'statusCode': 404,
-                'headers': {'Content-Type': 'application/json'},
-                'body': json.dumps({'success': False, 'message': f'Employee {employee_id} not found'})
+                'headers': _JSON_HEADERS,
+                'body': orjson.dumps({'success': False, 'message': f'Employee {employee_id} not found'}).decode()
             }
         
-        employee = employees[employee_id]
-        employee_name = employee['employee_name']
-        department = employee.get('department', 'N/A')
-        designation = employee.get('designation', 'N/A')
+        # Records already carry the 'N/A' defaults from load_employees_from_s3
+        employee_name, department, designation = employees[employee_id]
         
         # Generate certificate
-        date_str = datetime.now().strftime("%B %d, %Y")
-        pdf_bytes = generate_certificate_pdf(employee_name, employee_id, department, designation, date_str)
-        
-        # Convert to base64
-        pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+        now = datetime.now()
+        date_str = now.strftime("%B %d, %Y")
+        cert_date = now.strftime('%Y%m%d')
+        pdf_bytes = _build_pdf_cached(employee_name, employee_id, department, designation, date_str, cert_date)
         
         # Generate pledge ID
-        pledge_id = str(uuid.uuid4())
-        
-        # Save to DynamoDB
-        save_pledge_to_dynamodb(employee_id, employee_name, department, designation, pledge_id)
-        
-        # Upload to S3
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Random 128-bit ID, dashed like the UUIDs already stored in DynamoDB
+        u = os.urandom(16).hex()
+        pledge_id = f'{u[:8]}-{u[8:12]}-{u[12:16]}-{u[16:20]}-{u[20:]}'
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         s3_key = f"certificates/{employee_id}_{timestamp}.pdf"
         
+        # Save to DynamoDB and upload to S3 in the background
+        save_pledge_to_dynamodb(employee_id, employee_name, department, designation, pledge_id, now.isoformat())
+        ddb_future = _EXECUTOR.submit(flush_pledge_queue)
+        s3_future = _EXECUTOR.submit(upload_certificate_to_s3, s3_key, pdf_bytes)
+        
         try:
-            s3_client.put_object(
-                Bucket=BUCKET_NAME,
-                Key=s3_key,
-                Body=pdf_bytes,
-                ContentType='application/pdf'
+            # Presigning is local, so the response is built while the writes are in flight
+            body_prefix = _SUCCESS_BODY_TEMPLATE.format(
+                _json_value(employee_name),
+                _json_value(employee_id),
+                _json_value(department),
+                _json_value(designation),
+                _json_value(pledge_id),
+                _json_value(round(len(pdf_bytes) / 1024, 2))
             )
-            print(f"✓ Certificate uploaded to S3: {s3_key}")
-        except Exception as e:
-            print(f"⚠ S3 upload failed (non-critical): {str(e)}")
+            response_body = body_prefix + '"certificate_url":' + _json_value(generate_certificate_url(s3_key, employee_id)) + '}'
+        finally:
+            # Wait for both writes at the last moment, even if building the
+            # response failed, as Lambda freezes threads on return
+            ddb_future.result()
+            uploaded = s3_future.result()
+        if not uploaded:
+            # Browser cannot fetch from S3, so inline the PDF instead (base64 needs no JSON escaping)
+            response_body = body_prefix + '"pdf_base64":"' + base64.b64encode(pdf_bytes).decode('ascii') + '"}'
         
         print(f"✓ Pledge processed successfully for {employee_id}")
         
         # Return success - NO CORS headers (Function URL handles it)
         return {
             'statusCode': 200,
-            'headers': {'Content-Type': 'application/json'},  # Only Content-Type
-            'body': json.dumps({
-                'success': True,
-                'message': 'Pledge submitted successfully',
-                'employee_name': employee_name,
-                'employee_id': employee_id,
-                'department': department,
-                'designation': designation,
-                'pledge_id': pledge_id,
-                'pdf_base64': pdf_base64,
-                'certificate_size_kb': round(len(pdf_bytes) / 1024, 2)
-            })
+            'headers': _JSON_HEADERS,
+            'body': response_body
         }
         
     except Exception as e:
@@ -275,6 +474,6 @@ def lambda_handler(event, context):
         
         return {
             'statusCode': 500,
-            'headers': {'Content-Type': 'application/json'},
-            'body': json.dumps({'success': False, 'message': f'Internal server error: {str(e)}'})
-        }
\ No newline at end of file
+            'headers': _JSON_HEADERS,
+            'body': orjson.dumps({'success': False, 'message': f'Internal server error: {str(e)}'}).decode()
+        }
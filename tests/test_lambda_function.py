@@ -0,0 +1,191 @@
+import base64
+import json
+import os
+import re
+import sys
+import threading
+import time
+from io import BytesIO
+from unittest import mock
+
+from botocore.exceptions import ClientError
+from pypdf import PdfReader
+
+os.environ.setdefault('AWS_DEFAULT_REGION', 'ap-south-1')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import lambda_function  # noqa: E402
+
+
+def _load_csv(csv_bytes, s3=None):
+    """Run load_employees_from_s3 against an in-memory CSV"""
+    if s3 is None:
+        s3 = mock.MagicMock()
+        s3.get_object.return_value = {'Body': BytesIO(csv_bytes), 'ETag': '"test"', 'ContentLength': len(csv_bytes)}
+    with mock.patch.object(lambda_function, 's3_client', s3), \
+            mock.patch.object(lambda_function, '_CACHE_DATA', None), \
+            mock.patch.object(lambda_function, '_CACHE_ETAG', None), \
+            mock.patch.object(lambda_function, '_load_employees_snapshot', return_value=None), \
+            mock.patch.object(lambda_function, '_save_employees_snapshot'):
+        return lambda_function.load_employees_from_s3()
+
+
+def test_load_employees_tolerates_short_rows():
+    employees = _load_csv(
+        b"employee_id,employee_name,department,email,designation\n"
+        b"E1,Asha Rao,Risk,asha@example.com,AVP\n"
+        b"E2,B,HR\n"
+        b"\n"
+    )
+    assert employees['E1'] == ('Asha Rao', 'Risk', 'AVP')
+    assert employees['E2'] == ('B', 'HR', 'N/A')
+
+
+def test_load_employees_defaults_missing_columns():
+    employees = _load_csv(b"employee_id,employee_name\nE1,Asha Rao\n")
+    assert employees['E1'] == ('Asha Rao', 'N/A', 'N/A')
+
+
+def test_load_employees_fetches_large_csv_in_ranges():
+    csv_bytes = (
+        b"employee_id,employee_name,department,designation\n"
+        b"E1,Asha Rao,Risk,AVP\n"
+        b"E2,Ravi Iyer,Audit,Manager\n"
+    )
+
+    def get_object(Bucket, Key, Range=None, IfMatch=None):
+        if Range is None:
+            return {'Body': BytesIO(csv_bytes), 'ETag': '"v2"', 'ContentLength': len(csv_bytes)}
+        start, end = map(int, Range[len('bytes='):].split('-'))
+        return {'Body': BytesIO(csv_bytes[start:end + 1])}
+
+    s3 = mock.MagicMock()
+    s3.get_object.side_effect = get_object
+    with mock.patch.object(lambda_function, 'CSV_RANGE_CHUNK', 32), \
+            mock.patch.object(lambda_function, 'CSV_RANGE_THRESHOLD', 64):
+        employees = _load_csv(csv_bytes, s3)
+    assert employees == {'E1': ('Asha Rao', 'Risk', 'AVP'), 'E2': ('Ravi Iyer', 'Audit', 'Manager')}
+    ranged = [call.kwargs for call in s3.get_object.call_args_list if 'Range' in call.kwargs]
+    assert sorted(kwargs['Range'] for kwargs in ranged) == ['bytes=0-31', 'bytes=32-63', 'bytes=64-95', 'bytes=96-96']
+    assert {kwargs['IfMatch'] for kwargs in ranged} == {'"v2"'}
+
+
+def test_load_employees_reuses_memory_when_csv_unchanged():
+    employees = {'E1': ('Asha Rao', 'Risk', 'AVP')}
+    s3 = mock.MagicMock()
+    s3.get_object.side_effect = ClientError(
+        {'Error': {'Code': '304', 'Message': 'Not Modified'}, 'ResponseMetadata': {'HTTPStatusCode': 304}},
+        'GetObject'
+    )
+    with mock.patch.object(lambda_function, 's3_client', s3), \
+            mock.patch.object(lambda_function, '_CACHE_DATA', employees), \
+            mock.patch.object(lambda_function, '_CACHE_ETAG', '"v1"'), \
+            mock.patch.object(lambda_function, '_CACHE_TS', -lambda_function.CACHE_TTL), \
+            mock.patch.object(lambda_function, '_load_employees_snapshot') as load_snapshot:
+        assert lambda_function.load_employees_from_s3() is employees
+    assert s3.get_object.call_args.kwargs['IfNoneMatch'] == '"v1"'
+    load_snapshot.assert_not_called()
+
+
+def _submit_pledge(employees, s3):
+    """Run lambda_handler for employee E1 against mocked AWS clients"""
+    dynamodb = mock.MagicMock()
+    dynamodb.batch_write_item.return_value = {'UnprocessedItems': {}}
+    with mock.patch.object(lambda_function, 's3_client', s3), \
+            mock.patch.object(lambda_function, 'dynamodb', dynamodb), \
+            mock.patch.object(lambda_function, 'load_employees_from_s3', return_value=employees):
+        return lambda_function.lambda_handler(
+            {'body': '{"employee_id": "E1", "pledge_accepted": true}'}, None
+        )
+
+
+def test_handler_returns_defaults_from_employee_tuple():
+    s3 = mock.MagicMock()
+    s3.generate_presigned_url.return_value = 'https://example.com/cert.pdf'
+    response = _submit_pledge({'E1': ('Asha Rao', 'N/A', 'N/A')}, s3)
+    body = json.loads(response['body'])
+    assert response['statusCode'] == 200
+    assert (body['employee_name'], body['department'], body['designation']) == ('Asha Rao', 'N/A', 'N/A')
+    assert body['certificate_url'] == 'https://example.com/cert.pdf'
+
+
+def test_handler_inlines_pdf_when_upload_fails():
+    s3 = mock.MagicMock()
+    s3.put_object.side_effect = Exception('AccessDenied')
+    s3.generate_presigned_url.return_value = 'https://example.com/cert.pdf'
+    response = _submit_pledge({'E1': ('Asha Rao', 'Risk', 'AVP')}, s3)
+    body = json.loads(response['body'])
+    assert response['statusCode'] == 200
+    assert 'certificate_url' not in body
+    assert base64.b64decode(body['pdf_base64']).startswith(b'%PDF')
+
+
+def test_handler_waits_for_upload_when_presign_fails():
+    uploaded = threading.Event()
+
+    def slow_put_object(**kwargs):
+        time.sleep(0.1)
+        uploaded.set()
+
+    s3 = mock.MagicMock()
+    s3.put_object.side_effect = slow_put_object
+    s3.generate_presigned_url.side_effect = Exception('presign failed')
+    response = _submit_pledge({'E1': ('Asha Rao', 'Risk', 'AVP')}, s3)
+    assert response['statusCode'] == 500
+    assert uploaded.is_set()
+
+
+def test_success_bodies_escape_employee_values():
+    name, department = 'Asha "AR" Rao', 'Risk\\Compliance'
+    s3 = mock.MagicMock()
+    s3.generate_presigned_url.return_value = 'https://example.com/cert.pdf?a="b"'
+    url_body = json.loads(_submit_pledge({'E1': (name, department, 'AVP')}, s3)['body'])
+    assert (url_body['employee_name'], url_body['department']) == (name, department)
+    assert url_body['certificate_url'] == 'https://example.com/cert.pdf?a="b"'
+
+    s3.put_object.side_effect = Exception('AccessDenied')
+    inline_body = json.loads(_submit_pledge({'E1': (name, department, 'AVP')}, s3)['body'])
+    assert (inline_body['employee_name'], inline_body['department']) == (name, department)
+    assert inline_body['success'] is True and 'pdf_base64' in inline_body
+
+
+def test_flush_waits_for_in_progress_write():
+    write_started, release_write = threading.Event(), threading.Event()
+    written = []
+
+    def slow_batch_write(RequestItems):
+        write_started.set()
+        release_write.wait(5)
+        written.extend(RequestItems[lambda_function.DYNAMODB_TABLE])
+        return {'UnprocessedItems': {}}
+
+    dynamodb = mock.MagicMock()
+    dynamodb.batch_write_item.side_effect = slow_batch_write
+    with mock.patch.object(lambda_function, 'dynamodb', dynamodb):
+        lambda_function.save_pledge_to_dynamodb('E1', 'Asha Rao', 'Risk', 'AVP', 'p1', '2025-11-08T06:00:05')
+        first = threading.Thread(target=lambda_function.flush_pledge_queue)
+        first.start()
+        assert write_started.wait(5)
+
+        # A drain of the now-empty queue must not return before the write lands
+        second = threading.Thread(target=lambda_function.flush_pledge_queue)
+        second.start()
+        second.join(0.1)
+        assert second.is_alive()
+
+        release_write.set()
+        first.join(5)
+        second.join(5)
+    assert [item['PutRequest']['Item']['pledge_id'] for item in written] == ['p1']
+
+
+def test_certificate_declares_fonts_for_non_latin_names():
+    for name in ('Łukasz Żółć', '李小龙'):
+        pdf_bytes = lambda_function.generate_certificate_pdf(
+            name, 'E1', 'Risk', 'AVP', 'November 08, 2025', '20251108'
+        )
+        page = PdfReader(BytesIO(pdf_bytes)).pages[0]
+        used = set(re.findall(rb'/(F\d+) [\d.]+ Tf', page.get_contents().get_data()))
+        declared = {key[1:].encode() for key in page['/Resources']['/Font']}
+        assert used - declared == set(), name
+        assert 'Date of Pledge: November 08, 2025' in page.extract_text()